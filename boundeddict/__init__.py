@@ -4,11 +4,16 @@ A dictionary defined by ranges instead of discrete keys
 from __future__ import annotations
 import typing
 
-from uuid import uuid1
+from bisect import bisect_right
+from operator import itemgetter
 
+from . import _itree
+from . import _kernels
+from .entry import _MISSING
 from .entry import Bound
 from .entry import Comparable
 from .entry import Entry
+from .flat import FlatBoundedDict
 
 _KT = typing.TypeVar("_KT", bound=Comparable)
 _T = typing.TypeVar("_T")
@@ -19,64 +24,250 @@ class BoundedDict(typing.Dict[Bound[_KT], _T]):
     """
     A dictionary that uses bounds for keys instead of discrete values
     """
-    def __init__(self) -> None:
-        self.__entries: typing.List[Entry] = list()
+    def __init__(self, key_type: typing.Optional[type] = None) -> None:
+        self.__root: typing.Optional[_itree.IntervalNode[_KT, Entry[_T, _KT]]] = None
 
-    def get(self, key: _KEY, default=None) -> typing.Any:
-        if not isinstance(key, typing.Sequence) or len(key) != 2:
-            raise ValueError(
-                f"'{str(key)}' cannot be used as a key - "
-                "value must be a sequence of two values marking a lower and upper bound"
+        self.__contains_range = _kernels.make_comparator(key_type) if key_type is not None else None
+        """A comparator specialized to the promised key type, if one was given"""
+
+        self.__disjoint: bool = True
+        """Whether no two ranges in this dictionary touch or overlap"""
+
+        self.__lowers: typing.List[_KT] = list()
+        """The sorted lower bounds of every entry, only maintained while disjoint"""
+
+        self.__entries_sorted: typing.List[Entry[_T, _KT]] = list()
+        """The entries ordered by lower bound, parallel to `__lowers`"""
+
+    @classmethod
+    def from_intervals(
+        cls,
+        items: typing.Iterable[typing.Tuple[_KT, _KT, _T]]
+    ) -> BoundedDict[_KT, _T]:
+        """
+        Build a dictionary from a collection of `(lower_bound, upper_bound, value)` triples
+
+        The backing tree is constructed in one balanced pass over the sorted
+        input, so bulk loads cost O(n log n) rather than paying for n
+        individual inserts.
+
+        Args:
+            items: The triples to populate the dictionary with
+
+        Returns:
+            A new dictionary containing every given range
+        """
+        entries = [
+            (entry.lower_bound, entry.upper_bound, entry)
+            for entry in (
+                Entry(lower_bound=lower_bound, upper_bound=upper_bound, value=value)
+                for lower_bound, upper_bound, value in items
             )
-        
+        ]
+
+        entries.sort(key=itemgetter(0, 1))
+
+        bounded_dictionary: BoundedDict[_KT, _T] = cls()
+        bounded_dictionary.__root = _itree.build(entries, presorted=True)
+
+        for _, _, entry in entries:
+            if not bounded_dictionary.__disjoint:
+                break
+            bounded_dictionary.__track_disjoint(entry)
+
+        return bounded_dictionary
+
+    def get(self, key: _KEY, default=None) -> typing.Any:
         return self.search(key=key, default=default)
         
 
     def __getitem__(self, key: _KEY) -> _T:
-        if not isinstance(key, typing.Sequence) or len(key) != 2:
-            raise ValueError(
-                f"'{str(key)}' cannot be used as a key - "
-                "value must be a sequence of two values marking a lower and upper bound"
-            )
-        sentinel = uuid1()
-        searched_value = self.search(key=key, default=sentinel)
+        searched_value = self.search(key=key, default=_MISSING)
 
-        if searched_value == sentinel:
+        if searched_value is _MISSING:
             raise KeyError(f"There are no keys in this dictionary matching '{str(key)}'")
-        
+
         return searched_value
 
     def __setitem__(self, key: _KEY, value: _T):
-        if not isinstance(key, typing.Sequence) or len(key) != 2:
+        try:
+            lower_bound, upper_bound = key
+        except (TypeError, ValueError):
             raise ValueError(
                 f"'{str(key)}' cannot be used as a key - "
                 "value must be a sequence of two values marking a lower and upper bound"
             )
-        for entry in self.__entries:
-            if key in entry:
-                key.set(key, value)
 
-    @typing.overload
-    def search(self, lower_bound: _KT, upper_bound: _KT, default=None) -> typing.Optional[typing.Union[_T, typing.Sequence[_T]]]:
+        entry: Entry[_T, _KT] = Entry(lower_bound=lower_bound, upper_bound=upper_bound, value=value)
+        self.__root = _itree.insert(
+            self.__root,
+            entry.lower_bound,
+            entry.upper_bound,
+            entry
+        )
+
+        if self.__disjoint:
+            self.__track_disjoint(entry)
+
+    def __track_disjoint(self, entry: Entry[_T, _KT]) -> None:
         """
-        Search for a value
+        Fold a new entry into the sorted bookkeeping behind the disjoint fast path
+
+        Once an entry touches or overlaps an existing range the fast path is
+        abandoned for good and the bookkeeping is dropped.
+
+        Args:
+            entry: The entry that was just inserted
         """
-        return self.search(key=(lower_bound, upper_bound), default=default)
+        index = bisect_right(self.__lowers, entry.lower_bound)
+        previous_entry = self.__entries_sorted[index - 1] if index > 0 else None
+
+        if (
+            previous_entry is not None
+            and previous_entry.lower_bound == entry.lower_bound
+            and previous_entry.upper_bound == entry.upper_bound
+        ):
+            # The exact range already existed, so its value was simply replaced
+            self.__entries_sorted[index - 1] = entry
+        elif (
+            (previous_entry is not None and previous_entry.upper_bound >= entry.lower_bound)
+            or (index < len(self.__lowers) and self.__lowers[index] <= entry.upper_bound)
+        ):
+            self.__disjoint = False
+            self.__lowers.clear()
+            self.__entries_sorted.clear()
+        else:
+            self.__lowers.insert(index, entry.lower_bound)
+            self.__entries_sorted.insert(index, entry)
 
-    def search(self, key: _KEY, default=None) -> typing.Optional[typing.Union[_T, typing.Sequence[_T]]]:
+    @typing.overload
+    def search(self, lower_bound: _KT, upper_bound: _KT, default=None) -> typing.Optional[_T]:
+        ...
+
+    def search(self, key: _KEY, default=None) -> typing.Optional[_T]:
         """
         Search for a value
         """
-        if not isinstance(key, typing.Sequence) or len(key) != 2:
+        try:
+            lower_bound, upper_bound = key
+        except (TypeError, ValueError):
             raise ValueError(
                 f"'{str(key)}' cannot be used as a key - "
                 "value must be a sequence of two values marking a lower and upper bound"
             )
-        
-        for entry in self.__entries:
-            found_value = entry.search(key)
-            if found_value:
+
+        # Single-answer lookups go through the entries' memoized walk rather
+        # than the streaming iterator so repeated queries hit their caches
+        if self.__disjoint:
+            index = bisect_right(self.__lowers, lower_bound) - 1
+            if index >= 0:
+                entry = self.__entries_sorted[index]
+                if self.__contains_range is not None and not self.__contains_range(
+                    entry.lower_bound,
+                    entry.upper_bound,
+                    lower_bound,
+                    upper_bound
+                ):
+                    return default
+                found_value = entry._search_lo_hi(lower_bound, upper_bound)
+                if found_value is not _MISSING:
+                    return found_value
+            return default
+
+        for entry in _itree.stab(self.__root, lower_bound, upper_bound):
+            found_value = entry._search_lo_hi(lower_bound, upper_bound)
+            if found_value is not _MISSING:
                 return found_value
 
         return default
 
+    def iter_overlaps(self, lower_bound: _KT, upper_bound: _KT) -> typing.Iterator[_T]:
+        """
+        Lazily yield every value covering a range
+
+        Values arrive in ascending order of their entry's lower bound, with
+        nested entries answering before the entries they sit inside. Nothing
+        is allocated per match, so taking only the first answer costs no more
+        than a direct search and multi-match consumers may stop at any point.
+
+        Args:
+            lower_bound: The lower bound of the range to look for
+            upper_bound: The upper bound of the range to look for
+
+        Yields:
+            Each value covering the range
+        """
+        if self.__disjoint:
+            # No two ranges touch, so only the entry with the greatest lower
+            # bound at or below the query can contain it
+            index = bisect_right(self.__lowers, lower_bound) - 1
+            if index >= 0:
+                entry = self.__entries_sorted[index]
+                if self.__contains_range is not None and not self.__contains_range(
+                    entry.lower_bound,
+                    entry.upper_bound,
+                    lower_bound,
+                    upper_bound
+                ):
+                    return
+                yield from entry.iter_overlaps(lower_bound, upper_bound)
+            return
+
+        for entry in _itree.stab(self.__root, lower_bound, upper_bound):
+            yield from entry.iter_overlaps(lower_bound, upper_bound)
+
+    def search_batch(
+        self,
+        keys: typing.Iterable[_KEY],
+        default=None
+    ) -> typing.List[typing.Optional[_T]]:
+        """
+        Search for the value of every given key in one pass
+
+        Issuing many lookups through this method keeps the structures behind
+        the search bound to locals for the whole batch instead of re-resolving
+        them per query.
+
+        Args:
+            keys: The keys to look up, each a pair of a lower and upper bound
+            default: The value to report for keys matching nothing
+
+        Returns:
+            The found value for each key, in the order the keys were given
+        """
+        found_values: typing.List[typing.Optional[_T]] = list()
+        append = found_values.append
+
+        disjoint = self.__disjoint
+        lowers = self.__lowers
+        entries_sorted = self.__entries_sorted
+        root = self.__root
+        stab = _itree.stab
+
+        for key in keys:
+            try:
+                lower_bound, upper_bound = key
+            except (TypeError, ValueError):
+                raise ValueError(
+                    f"'{str(key)}' cannot be used as a key - "
+                    "value must be a sequence of two values marking a lower and upper bound"
+                )
+
+            found_value = _MISSING
+
+            if disjoint:
+                index = bisect_right(lowers, lower_bound) - 1
+                if index >= 0:
+                    found_value = entries_sorted[index]._search_lo_hi(lower_bound, upper_bound)
+            else:
+                for entry in stab(root, lower_bound, upper_bound):
+                    found_value = entry._search_lo_hi(lower_bound, upper_bound)
+                    if found_value is not _MISSING:
+                        break
+                else:
+                    found_value = _MISSING
+
+            append(default if found_value is _MISSING else found_value)
+
+        return found_values
+
@@ -0,0 +1,298 @@
+"""
+An augmented AVL interval tree used as the backing store for the bounded dict
+
+Nodes are keyed on their lower bound and each carries the maximum upper bound
+found anywhere in its subtree, allowing entire subtrees to be skipped during
+a search when they cannot possibly contain the queried range.
+"""
+from __future__ import annotations
+
+import typing
+
+from operator import itemgetter
+
+_KT = typing.TypeVar("_KT")
+_T = typing.TypeVar("_T")
+
+
+class IntervalNode(typing.Generic[_KT, _T]):
+    """
+    A single node within the interval tree
+    """
+    __slots__ = ('lo', 'hi', 'max_hi', 'value', 'left', 'right', 'height')
+
+    def __init__(self, lo: _KT, hi: _KT, value: _T) -> None:
+        self.lo: _KT = lo
+        """The lower bound of this node's range"""
+
+        self.hi: _KT = hi
+        """The upper bound of this node's range"""
+
+        self.max_hi: _KT = hi
+        """The largest upper bound within this node's subtree"""
+
+        self.value: _T = value
+        """The value stored at this node"""
+
+        self.left: typing.Optional[IntervalNode[_KT, _T]] = None
+        """This node's left child"""
+
+        self.right: typing.Optional[IntervalNode[_KT, _T]] = None
+        """This node's right child"""
+
+        self.height: int = 1
+        """The height of the subtree rooted at this node"""
+
+    def __str__(self):
+        return f"[{self.lo}, {self.hi}]: {self.value}"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+def _height(node: typing.Optional[IntervalNode]) -> int:
+    return node.height if node else 0
+
+
+def _update(node: IntervalNode) -> None:
+    """
+    Recompute the height and `max_hi` of a node from its children
+    """
+    node.height = 1 + max(_height(node.left), _height(node.right))
+
+    max_hi = node.hi
+
+    if node.left and node.left.max_hi > max_hi:
+        max_hi = node.left.max_hi
+
+    if node.right and node.right.max_hi > max_hi:
+        max_hi = node.right.max_hi
+
+    node.max_hi = max_hi
+
+
+def _balance_factor(node: IntervalNode) -> int:
+    return _height(node.left) - _height(node.right)
+
+
+def _rotate_left(node: IntervalNode) -> IntervalNode:
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+
+    _update(node)
+    _update(pivot)
+
+    return pivot
+
+
+def _rotate_right(node: IntervalNode) -> IntervalNode:
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+
+    _update(node)
+    _update(pivot)
+
+    return pivot
+
+
+def _rebalance(node: IntervalNode) -> IntervalNode:
+    """
+    Restore the AVL balance invariant at a node, rotating if needed
+    """
+    _update(node)
+    balance = _balance_factor(node)
+
+    if balance > 1:
+        if _balance_factor(node.left) < 0:
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+
+    if balance < -1:
+        if _balance_factor(node.right) > 0:
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+
+    return node
+
+
+def insert(
+    root: typing.Optional[IntervalNode[_KT, _T]],
+    lo: _KT,
+    hi: _KT,
+    value: _T
+) -> IntervalNode[_KT, _T]:
+    """
+    Insert a range into the tree, replacing the value if the exact range is already present
+
+    Args:
+        root: The root of the tree or subtree to insert into
+        lo: The lower bound of the range to insert
+        hi: The upper bound of the range to insert
+        value: The value to store for the range
+
+    Returns:
+        The new root of the tree or subtree
+    """
+    if root is None:
+        return IntervalNode(lo=lo, hi=hi, value=value)
+
+    if lo == root.lo and hi == root.hi:
+        root.value = value
+        return root
+
+    if (lo, hi) < (root.lo, root.hi):
+        root.left = insert(root.left, lo, hi, value)
+    else:
+        root.right = insert(root.right, lo, hi, value)
+
+    return _rebalance(root)
+
+
+def delete(
+    root: typing.Optional[IntervalNode[_KT, _T]],
+    lo: _KT,
+    hi: _KT
+) -> typing.Optional[IntervalNode[_KT, _T]]:
+    """
+    Remove the node matching the exact range from the tree
+
+    Args:
+        root: The root of the tree or subtree to remove from
+        lo: The lower bound of the range to remove
+        hi: The upper bound of the range to remove
+
+    Returns:
+        The new root of the tree or subtree
+
+    Raises:
+        KeyError: The exact range was not present in the tree
+    """
+    if root is None:
+        raise KeyError(f"There is no entry in this tree bounded by '[{lo}, {hi}]'")
+
+    if lo == root.lo and hi == root.hi:
+        if root.left is None:
+            return root.right
+
+        if root.right is None:
+            return root.left
+
+        successor = root.right
+        while successor.left:
+            successor = successor.left
+
+        root.lo = successor.lo
+        root.hi = successor.hi
+        root.value = successor.value
+        root.right = delete(root.right, successor.lo, successor.hi)
+    elif (lo, hi) < (root.lo, root.hi):
+        root.left = delete(root.left, lo, hi)
+    else:
+        root.right = delete(root.right, lo, hi)
+
+    return _rebalance(root)
+
+
+def build(
+    items: typing.List[typing.Tuple[_KT, _KT, _T]],
+    presorted: bool = False
+) -> typing.Optional[IntervalNode[_KT, _T]]:
+    """
+    Build a height-balanced tree from a collection of `(lo, hi, value)` triples in one pass
+
+    The items are sorted at most once by their bounds and the middle element
+    of each span becomes the root of its subtree, so the result is balanced
+    without any rotations and construction stays O(n log n). The recursion
+    works purely on index ranges into the sorted list - no slices are copied
+    and nothing is re-sorted per level. Exact duplicate ranges collapse to
+    their last given value, matching what repeated inserts would leave behind.
+
+    Args:
+        items: The triples to build the tree from
+        presorted: Whether the items are already ordered by their bounds
+
+    Returns:
+        The root of the new tree
+    """
+    if not presorted:
+        items = sorted(items, key=itemgetter(0, 1))
+
+    # The sort is stable, so the last item of an equal-bounds run is the one
+    # a sequence of inserts would have kept
+    deduplicated: typing.List[typing.Tuple[_KT, _KT, _T]] = list()
+    for item in items:
+        if deduplicated and deduplicated[-1][0] == item[0] and deduplicated[-1][1] == item[1]:
+            deduplicated[-1] = item
+        else:
+            deduplicated.append(item)
+
+    return _build_sorted(deduplicated, 0, len(deduplicated))
+
+
+def _build_sorted(
+    items: typing.List[typing.Tuple[_KT, _KT, _T]],
+    start: int,
+    stop: int
+) -> typing.Optional[IntervalNode[_KT, _T]]:
+    """
+    Build a subtree from a sorted run of triples, filling in `max_hi` on the way back up
+    """
+    if start >= stop:
+        return None
+
+    middle = (start + stop) // 2
+    lo, hi, value = items[middle]
+
+    node: IntervalNode[_KT, _T] = IntervalNode(lo=lo, hi=hi, value=value)
+    node.left = _build_sorted(items, start, middle)
+    node.right = _build_sorted(items, middle + 1, stop)
+    _update(node)
+
+    return node
+
+
+def stab(
+    root: typing.Optional[IntervalNode[_KT, _T]],
+    lo: _KT,
+    hi: _KT
+) -> typing.Iterator[_T]:
+    """
+    Yield the values of every range that fully contains `[lo, hi]`, in order of ascending lower bound
+
+    Subtrees whose `max_hi` falls short of the queried upper bound are skipped
+    entirely, as nothing within them can contain the queried range.
+
+    Args:
+        root: The root of the tree or subtree to search
+        lo: The lower bound of the queried range
+        hi: The upper bound of the queried range
+
+    Yields:
+        The value of each containing range
+    """
+    if root is None:
+        return
+
+    # An explicit stack keeps the whole traversal in one frame rather than
+    # paying for a nested generator per tree level
+    stack: typing.List[typing.Tuple[IntervalNode[_KT, _T], bool]] = [(root, False)]
+
+    while stack:
+        node, expanded = stack.pop()
+
+        if expanded:
+            if node.lo <= lo and hi <= node.hi:
+                yield node.value
+            continue
+
+        right = node.right
+        if right is not None and node.lo <= lo and right.max_hi >= hi:
+            stack.append((right, False))
+
+        stack.append((node, True))
+
+        left = node.left
+        if left is not None and left.max_hi >= hi:
+            stack.append((left, False))
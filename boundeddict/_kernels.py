@@ -0,0 +1,100 @@
+"""
+Scalar comparison kernels for numeric bounds
+
+The hot interval predicates operate on raw numbers rather than on `Bound`
+objects, so callers pay for attribute loads once and the comparisons run on
+plain scalars. When numba is installed the kernels are JIT compiled and warmed
+at import time; otherwise the pure Python definitions are used as-is.
+"""
+from __future__ import annotations
+
+import typing
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def contains(lo: float, hi: float, value: float) -> bool:
+    """
+    Whether a value falls within a range
+
+    Args:
+        lo: The lower bound of the range
+        hi: The upper bound of the range
+        value: The value to look for
+
+    Returns:
+        Whether the value falls within the range
+    """
+    return lo <= value <= hi
+
+
+def overlaps(a_lo: float, a_hi: float, b_lo: float, b_hi: float) -> bool:
+    """
+    Whether two ranges overlap
+
+    Args:
+        a_lo: The lower bound of the first range
+        a_hi: The upper bound of the first range
+        b_lo: The lower bound of the second range
+        b_hi: The upper bound of the second range
+
+    Returns:
+        Whether the two ranges overlap
+    """
+    return a_lo <= b_hi and b_lo <= a_hi
+
+
+def distance(a_lo: float, a_hi: float, b_lo: float, b_hi: float) -> float:
+    """
+    The distance between two ranges
+
+    Args:
+        a_lo: The lower bound of the first range
+        a_hi: The upper bound of the first range
+        b_lo: The lower bound of the second range
+        b_hi: The upper bound of the second range
+
+    Returns:
+        The distance between the two ranges
+    """
+    return (b_lo - a_lo) + (a_hi - b_hi)
+
+
+def make_comparator(key_type: type) -> typing.Callable[[typing.Any, typing.Any, typing.Any, typing.Any], bool]:
+    """
+    Build a range containment comparator specialized to a single key type
+
+    With numba installed and a primitive numeric key type, the comparator is
+    compiled eagerly against a monomorphic signature so every later call runs
+    without dynamic dispatch. Otherwise a plain closure performing the same
+    test is returned.
+
+    Args:
+        key_type: The type every key in the dictionary will share
+
+    Returns:
+        A function answering whether `[q_lo, q_hi]` falls within `[lo, hi]`
+    """
+    if njit is not None and key_type in (int, float):
+        from numba import boolean, float64, int64
+
+        scalar = int64 if key_type is int else float64
+        return njit(boolean(scalar, scalar, scalar, scalar), cache=True)(
+            lambda lo, hi, q_lo, q_hi: lo <= q_lo and q_hi <= hi
+        )
+
+    return lambda lo, hi, q_lo, q_hi: lo <= q_lo and q_hi <= hi
+
+
+if njit is not None:
+    contains = njit(cache=True, fastmath=True)(contains)
+    overlaps = njit(cache=True, fastmath=True)(overlaps)
+    distance = njit(cache=True, fastmath=True)(distance)
+
+    # Compile once at import so the first user call doesn't pay the JIT cost
+    contains(0.0, 1.0, 0.5)
+    overlaps(0.0, 1.0, 0.5, 1.5)
+    distance(0.0, 1.0, 0.5, 1.5)
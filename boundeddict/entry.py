@@ -5,9 +5,22 @@ from __future__ import annotations
 
 import typing
 
+from bisect import bisect_right
+from functools import lru_cache
+from datetime import datetime
+from decimal import Decimal
+
+from . import _kernels
+
 T = typing.TypeVar("T")
 _KT = typing.TypeVar("_KT")
 
+_NUMERIC_TYPES = (int, float)
+"""Key types whose comparisons may be routed through the scalar kernels"""
+
+_MISSING: typing.Final = object()
+"""A sentinel used to tell a missing value apart from a stored falsy one"""
+
 
 @typing.runtime_checkable
 class Comparable(typing.Protocol, typing.Generic[T]):
@@ -31,37 +44,65 @@ class Comparable(typing.Protocol, typing.Generic[T]):
         ...
 
 
+_COMPARABLE_TYPES: typing.Set[type] = {int, float, str, bytes, datetime, Decimal}
+"""Types already known to satisfy `Comparable`"""
+
+_NONCOMPARABLE_TYPES: typing.Set[type] = set()
+"""Types already known to fail the `Comparable` check"""
+
+
+def _is_comparable(value: typing.Any) -> bool:
+    """
+    Whether a value may be used as a bound
+
+    Whether a type is comparable never changes, so the result of the
+    expensive structural protocol check is cached per type and all later
+    values of that type cost only a set membership test.
+
+    Args:
+        value: The value to vet
+
+    Returns:
+        Whether the value implements the comparison functions
+    """
+    value_type = type(value)
+
+    if value_type in _COMPARABLE_TYPES:
+        return True
+
+    if value_type in _NONCOMPARABLE_TYPES:
+        return False
+
+    comparable = isinstance(value, Comparable)
+
+    if comparable:
+        _COMPARABLE_TYPES.add(value_type)
+    else:
+        _NONCOMPARABLE_TYPES.add(value_type)
+
+    return comparable
+
+
 class Bound(typing.Generic[T]):
     """
     Defines the boundaries of the key
     """
+    __slots__ = ('lower_bound', 'upper_bound')
 
     def __init__(self, lower: Comparable[T], upper: Comparable[T]):
-        if not isinstance(lower, Comparable):
+        if not _is_comparable(lower):
             raise ValueError(
                 f"'{str(lower)}' may not be used as a lower bound - only comparable values are allowed"
             )
-        self.__lower: T = lower
+        self.lower_bound: T = lower
         """The least acceptable value"""
 
-        self.__upper: T = upper
+        self.upper_bound: T = upper
         """The largest acceptable value"""
 
-    @property
-    def lower_bound(self) -> T:
-        """
-        The least acceptable value
-        """
-        return self.__lower
-
-    @property
-    def upper_bound(self) -> T:
-        """
-        The largest acceptable value
-        """
-        return self.__upper
-
     def __contains__(self, value: T) -> bool:
+        if type(self.lower_bound) in _NUMERIC_TYPES and type(value) in _NUMERIC_TYPES:
+            return _kernels.contains(self.lower_bound, self.upper_bound, value)
         return self.lower_bound <= value <= self.upper_bound
 
     def intersects_on_left(self, other: Bound[T]) -> bool:
@@ -91,6 +132,8 @@ class Bound(typing.Generic[T]):
         Returns:
             Whether this bound intersects another bound on the left hand side
         """
+        if type(self.lower_bound) in _NUMERIC_TYPES and type(other.lower_bound) in _NUMERIC_TYPES:
+            return _kernels.contains(other.lower_bound, other.upper_bound, self.upper_bound)
         return other.lower_bound <= self.upper_bound <= other.upper_bound
 
     def intersects_on_right(self, other: Bound[T]) -> bool:
@@ -116,6 +159,8 @@ class Bound(typing.Generic[T]):
         Returns:
             Whether this bound intersects on the right
         """
+        if type(self.lower_bound) in _NUMERIC_TYPES and type(other.lower_bound) in _NUMERIC_TYPES:
+            return _kernels.contains(self.lower_bound, self.upper_bound, other.lower_bound)
         return self.lower_bound <= other.lower_bound <= self.upper_bound
 
     def intersects(self, other: Bound[T]) -> bool:
@@ -143,14 +188,18 @@ class Bound(typing.Generic[T]):
             other: The other set of bounds to compare to
 
         Returns:
-            Whether this bound intersects with the other 
+            Whether this bound intersects with the other
         """
-        return self.intersects_on_left(other) or self.intersects_on_right(other)
+        if type(self.lower_bound) in _NUMERIC_TYPES and type(other.lower_bound) in _NUMERIC_TYPES:
+            return _kernels.overlaps(self.lower_bound, self.upper_bound, other.lower_bound, other.upper_bound)
+        return self.lower_bound <= other.upper_bound and other.lower_bound <= self.upper_bound
 
     def distance_from(self, lower_bound: _KT, upper_bound: _KT):
         """
         Determines the distance between one bound and another
         """
+        if type(self.lower_bound) in _NUMERIC_TYPES and type(lower_bound) in _NUMERIC_TYPES:
+            return _kernels.distance(self.lower_bound, self.upper_bound, lower_bound, upper_bound)
         return (lower_bound - self.lower_bound) + (self.upper_bound - upper_bound)
 
 
@@ -166,49 +215,79 @@ class Entry(typing.Generic[T, _KT]):
     """
     Represents an individual value within a Bounded Dictionary
     """
+    __slots__ = (
+        'lower_bound',
+        'upper_bound',
+        '_Entry__bound',
+        '_Entry__value',
+        '_Entry__child_lo',
+        '_Entry__child_hi',
+        '_Entry__children',
+        '_search_cached',
+    )
+
     def __init__(self, lower_bound: _KT, upper_bound: _KT, value: T) -> None:
         if lower_bound > upper_bound:
             lower_bound, upper_bound = upper_bound, lower_bound
 
         self.__bound: Bound[_KT] = Bound(lower=lower_bound, upper=upper_bound)
+
+        self.lower_bound: _KT = lower_bound
+        """The lower bound defining what may be in this entry"""
+
+        self.upper_bound: _KT = upper_bound
+        """The upper bound defining what may be in this entry"""
+
         self.__value = value
-        self.__children: typing.List[Entry[T, _KT]] = list()
 
-    @typing.overload
-    def set(self, bound: typing.Tuple[_KT, _KT], value: T) -> None:
-        lower_bound, upper_bound = bound
+        self.__child_lo: typing.List[_KT] = list()
+        """The lower bounds of each child, parallel to `__children` and kept sorted"""
 
-        if lower_bound > upper_bound:
-            lower_bound, upper_bound = upper_bound, lower_bound
+        self.__child_hi: typing.List[_KT] = list()
+        """The upper bounds of each child, parallel to `__children`"""
 
-        return self.set(lower_bound=lower_bound, upper_bound=upper_bound, value=value)
+        self.__children: typing.List[Entry[T, _KT]] = list()
+        """The entries nested within this one, ordered by their lower bounds"""
 
-    @typing.overload
-    def set(self, bounds: slice[_KT], value: T):
-        if bounds.start is None:
-            lower_bound = self.lower_bound
-        else:
-            lower_bound = bounds.start
+        self._search_cached = lru_cache(maxsize=256)(self._search_impl)
+        """A memoized view of `_search_impl`, cleared whenever this entry mutates"""
 
-        if bounds.stop is None:
-            upper_bound = self.upper_bound
-        else:
-            upper_bound = bounds.stop
+    def _add_child(self, lower_bound: _KT, upper_bound: _KT, value: T) -> None:
+        """
+        Nest a new entry within this one
 
-        if lower_bound > upper_bound:
-            lower_bound, upper_bound = upper_bound, lower_bound
+        Args:
+            lower_bound: The lower bound of the new entry
+            upper_bound: The upper bound of the new entry
+            value: The value for the new entry
+        """
+        child: Entry[T, _KT] = Entry(lower_bound=lower_bound, upper_bound=upper_bound, value=value)
+        self._search_cached.cache_clear()
+        index = bisect_right(self.__child_lo, child.lower_bound)
+        self.__child_lo.insert(index, child.lower_bound)
+        self.__child_hi.insert(index, child.upper_bound)
+        self.__children.insert(index, child)
 
-        return self.set(lower_bound=lower_bound, upper_bound=upper_bound, value=value)
+    @typing.overload
+    def set(self, bound: typing.Tuple[_KT, _KT], value: T) -> None:
+        ...
+
+    @typing.overload
+    def set(self, bounds: slice[_KT], value: T):
+        ...
 
     def set(self, lower_bound: _KT, upper_bound: _KT, value: T) -> None:
         """
         Set the value on this entry or one of its children
+
+        The bounds are expected to already be normalized - callers are
+        responsible for swapping an out of order pair before reaching here.
         """
-        if lower_bound > upper_bound:
-            lower_bound, upper_bound = upper_bound, lower_bound
+        assert not lower_bound > upper_bound, "Bounds must be normalized before being set"
 
         if self.lower_bound == lower_bound and self.upper_bound == upper_bound:
-            self.value = value
+            self._search_cached.cache_clear()
+            self.__value = value
 
     @property
     def value(self) -> T:
@@ -224,20 +303,6 @@ class Entry(typing.Generic[T, _KT]):
         """
         return self.__bound
 
-    @property
-    def lower_bound(self) -> _KT:
-        """
-        The lower bound defining what may be in this entry
-        """
-        return self.__bound.lower_bound
-
-    @property
-    def upper_bound(self) -> _KT:
-        """
-        The lower bound defining what may be in this entry
-        """
-        return self.__bound.upper_bound
-
     @typing.overload
     def search(self, lower_bound: _KT, upper_bound: _KT) -> typing.Optional[typing.Union[T, typing.Sequence[T]]]:
         """
@@ -245,39 +310,106 @@ class Entry(typing.Generic[T, _KT]):
         """
         return self.search((lower_bound, upper_bound))
 
-    def search(self, bounds: typing.Tuple[_KT, _KT]) -> typing.Optional[typing.Union[T, typing.Sequence[T]]]:
+    def search(self, bounds: typing.Tuple[_KT, _KT]) -> typing.Optional[T]:
         """
         Look for a value nested within this entry
         """
-        if not isinstance(bounds, typing.Sequence) or len(bounds) != 2:
+        try:
+            lower_bound, upper_bound = bounds
+        except (TypeError, ValueError):
             raise ValueError(
                 f"'{str(bounds)}' cannot be used to search - "
                 "value must be a sequence of two values marking a lower and upper bound"
             )
 
-        if bounds not in self:
-            return None
+        found_value = self._search_lo_hi(lower_bound, upper_bound)
+        return None if found_value is _MISSING else found_value
+
+    def search_one(self, lower_bound: _KT, upper_bound: _KT) -> typing.Optional[T]:
+        """
+        Look for the single most specific value covering a range
+
+        Args:
+            lower_bound: The lower bound of the range to look for
+            upper_bound: The upper bound of the range to look for
+
+        Returns:
+            The most deeply nested value covering the range, if any covers it at all
+        """
+        found_value = self._search_lo_hi(lower_bound, upper_bound)
+        return None if found_value is _MISSING else found_value
+
+    def iter_overlaps(self, lower_bound: _KT, upper_bound: _KT) -> typing.Iterator[T]:
+        """
+        Lazily yield every value covering a range, most deeply nested first
+
+        Nothing is allocated per match and callers may stop consuming at any
+        point, so taking only the first answer costs no more than a direct
+        search.
+
+        Args:
+            lower_bound: The lower bound of the range to look for
+            upper_bound: The upper bound of the range to look for
+
+        Yields:
+            Each value covering the range
+        """
+        if not self._contains_lo_hi(lower_bound, upper_bound):
+            return
+
+        for index in range(bisect_right(self.__child_lo, lower_bound)):
+            if upper_bound <= self.__child_hi[index]:
+                yield from self.__children[index].iter_overlaps(lower_bound, upper_bound)
+
+        yield self.__value
 
-        candidates: typing.List[Entry[T, _KT]] = list({
-            child_entry.search(bounds)
-            for child_entry in self.__children
-            if bounds in child_entry
-        })
+    def _contains_lo_hi(self, lower_bound: _KT, upper_bound: _KT) -> bool:
+        """
+        Whether the range between two already unpacked bounds falls within this entry
+        """
+        return self.lower_bound <= lower_bound and upper_bound <= self.upper_bound
+
+    def _search_lo_hi(self, lower_bound: _KT, upper_bound: _KT) -> typing.Union[T, object]:
+        """
+        Look for a value nested within this entry without any tuple packing
 
-        if candidates and len(candidates) == 1:
-            return candidates[0]
-        elif candidates and len(candidates) > 1:
-            return candidates
+        Results are memoized per entry so repeated queries over the same
+        range skip the walk entirely. Bounds that can't be hashed can't be
+        memoized and take the uncached walk instead.
+        """
+        try:
+            return self._search_cached(lower_bound, upper_bound)
+        except TypeError:
+            return self._search_impl(lower_bound, upper_bound)
 
-        return self.value
+    def _search_impl(self, lower_bound: _KT, upper_bound: _KT) -> typing.Union[T, object]:
+        """
+        The uncached search walk behind `_search_lo_hi`
+
+        The first child able to contain the range answers for it; `_MISSING`
+        comes back when the range doesn't fall within this entry at all.
+        """
+        if not self._contains_lo_hi(lower_bound, upper_bound):
+            return _MISSING
+
+        # Children are sorted by their lower bounds, so only the prefix whose
+        # lower bounds don't exceed the queried one can contain the range
+        for index in range(bisect_right(self.__child_lo, lower_bound)):
+            if upper_bound <= self.__child_hi[index]:
+                found_value = self.__children[index]._search_lo_hi(lower_bound, upper_bound)
+                if found_value is not _MISSING:
+                    return found_value
+
+        return self.__value
 
     def __contains__(self, bounds: typing.Tuple[_KT, _KT]) -> bool:
-        if not isinstance(bounds, typing.Sequence) or len(bounds) != 2:
+        try:
+            lower_bound, upper_bound = bounds
+        except (TypeError, ValueError):
             raise ValueError(
                 f"'{str(bounds)}' cannot be used to check for containment - "
                 "value must be a sequence of two values marking a lower and upper bound"
             )
 
-        lower_bound, upper_bound = bounds
-        return self.bounds.lower_bound <= lower_bound and upper_bound <= self.bounds.upper_bound
+        return self.lower_bound <= lower_bound and upper_bound <= self.upper_bound
     
\ No newline at end of file
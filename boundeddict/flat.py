@@ -0,0 +1,104 @@
+"""
+A flat, column-oriented variant of the bounded dict for numeric keys
+
+Ranges that never nest don't need an `Entry` and `Bound` object apiece; this
+variant keeps every lower bound, upper bound, and value in three parallel
+columns, with the bounds packed into typed arrays. The per-range footprint
+drops to two machine scalars plus a list slot, and searches scan contiguous
+memory rather than chasing pointers between objects.
+"""
+from __future__ import annotations
+
+import typing
+
+from array import array
+
+from .entry import _MISSING
+
+_T = typing.TypeVar("_T")
+
+_TYPECODES: typing.Dict[type, str] = {int: 'q', float: 'd'}
+"""The array typecode used to pack the bounds of each supported key type"""
+
+
+class FlatBoundedDict(typing.Generic[_T]):
+    """
+    A bounded dictionary holding flat, numeric ranges in packed parallel columns
+    """
+    __slots__ = ('_FlatBoundedDict__lo', '_FlatBoundedDict__hi', '_FlatBoundedDict__values')
+
+    def __init__(self, key_type: type = float) -> None:
+        typecode = _TYPECODES.get(key_type)
+
+        if typecode is None:
+            raise ValueError(
+                f"'{key_type}' may not be used as the key type for a flat bounded dictionary - "
+                f"only {', '.join(sorted(supported.__name__ for supported in _TYPECODES))} keys may be packed"
+            )
+
+        self.__lo: array = array(typecode)
+        """The lower bound of each range, in insertion order"""
+
+        self.__hi: array = array(typecode)
+        """The upper bound of each range, parallel to `__lo`"""
+
+        self.__values: typing.List[_T] = list()
+        """The value for each range, parallel to `__lo`"""
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def get(self, key: typing.Tuple[float, float], default=None) -> typing.Any:
+        return self.search(key=key, default=default)
+
+    def __getitem__(self, key: typing.Tuple[float, float]) -> _T:
+        searched_value = self.search(key=key, default=_MISSING)
+
+        if searched_value is _MISSING:
+            raise KeyError(f"There are no keys in this dictionary matching '{str(key)}'")
+
+        return searched_value
+
+    def __setitem__(self, key: typing.Tuple[float, float], value: _T):
+        try:
+            lower_bound, upper_bound = key
+        except (TypeError, ValueError):
+            raise ValueError(
+                f"'{str(key)}' cannot be used as a key - "
+                "value must be a sequence of two values marking a lower and upper bound"
+            )
+
+        if lower_bound > upper_bound:
+            lower_bound, upper_bound = upper_bound, lower_bound
+
+        # Pack both bounds up front so an unpackable one fails here, before
+        # any column mutates and the three columns can fall out of step
+        packed = array(self.__lo.typecode, (lower_bound, upper_bound))
+        lower_bound, upper_bound = packed
+
+        for index, (existing_lower, existing_upper) in enumerate(zip(self.__lo, self.__hi)):
+            if existing_lower == lower_bound and existing_upper == upper_bound:
+                self.__values[index] = value
+                return
+
+        self.__lo.append(lower_bound)
+        self.__hi.append(upper_bound)
+        self.__values.append(value)
+
+    def search(self, key: typing.Tuple[float, float], default=None) -> typing.Optional[_T]:
+        """
+        Search for a value
+        """
+        try:
+            lower_bound, upper_bound = key
+        except (TypeError, ValueError):
+            raise ValueError(
+                f"'{str(key)}' cannot be used as a key - "
+                "value must be a sequence of two values marking a lower and upper bound"
+            )
+
+        for index, (existing_lower, existing_upper) in enumerate(zip(self.__lo, self.__hi)):
+            if existing_lower <= lower_bound and upper_bound <= existing_upper:
+                return self.__values[index]
+
+        return default